@@ -34,7 +34,9 @@ class Awaiting(Base, AwaitingHttp):
 
         self._client = AsyncClient(
             auth=self._basic_auth,
-            timeout=self._timeout
+            timeout=self._timeout,
+            limits=self._limits,
+            http2=self._http2
         )
 
     async def __aenter__(self) -> Awaiting:
@@ -92,13 +94,20 @@ class Awaiting(Base, AwaitingHttp):
 
         return ServerModel(data), self.server(data["id"])
 
-    def server(self, server_id: str) -> ServerAwaiting:
+    def server(self, server_id: str, meta_ttl: float = 1.0,
+               metrics_ttl: float = 0.5) -> ServerAwaiting:
         """Used for interacting with a server.
 
         Parameters
         ----------
         server_id : str
             Datahost server ID.
+        meta_ttl : float, optional
+            Seconds get() results are cached for, 0 disables,
+            by default 1.0
+        metrics_ttl : float, optional
+            Seconds metrics() results are cached for, 0 disables,
+            by default 0.5
 
         Returns
         -------
@@ -106,7 +115,7 @@ class Awaiting(Base, AwaitingHttp):
             Used to interact with the server.
         """
 
-        return ServerAwaiting(self, server_id)
+        return ServerAwaiting(self, server_id, meta_ttl, metrics_ttl)
 
     async def servers(self) -> AsyncGenerator[
             ServerModel, ServerAwaiting]:
@@ -156,7 +165,9 @@ class Blocking(Base, BlockingHttp):
 
         self._client = Client(
             auth=self._basic_auth,
-            timeout=self._timeout
+            timeout=self._timeout,
+            limits=self._limits,
+            http2=self._http2
         )
 
     def __enter__(self) -> Blocking:
@@ -214,13 +225,20 @@ class Blocking(Base, BlockingHttp):
 
         return ServerModel(data), self.server(data["id"])
 
-    def server(self, server_id: str) -> ServerBlocking:
+    def server(self, server_id: str, meta_ttl: float = 1.0,
+               metrics_ttl: float = 0.5) -> ServerBlocking:
         """Used for interacting with a server.
 
         Parameters
         ----------
         server_id : str
             Datahost server ID.
+        meta_ttl : float, optional
+            Seconds get() results are cached for, 0 disables,
+            by default 1.0
+        metrics_ttl : float, optional
+            Seconds metrics() results are cached for, 0 disables,
+            by default 0.5
 
         Returns
         -------
@@ -228,7 +246,7 @@ class Blocking(Base, BlockingHttp):
             Used to interact with the server.
         """
 
-        return ServerBlocking(self, server_id)
+        return ServerBlocking(self, server_id, meta_ttl, metrics_ttl)
 
     def servers(self) -> Generator[ServerModel, ServerBlocking, None]:
         """Used to list servers.
@@ -1,8 +1,20 @@
-from httpx import BasicAuth
+from collections import OrderedDict
+
+from httpx import BasicAuth, Limits
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    HTTP2 = False
+else:
+    HTTP2 = True
 
 
 class Base:
-    def __init__(self, email: str, password: str, timeout: int = 60) -> None:
+    def __init__(self, email: str, password: str, timeout: int = 60,
+                 max_connections: int = 100,
+                 keepalive_expiry: float = 75,
+                 http2: bool = HTTP2) -> None:
         """Used to create Dathost basic auth.
 
         Parameters
@@ -13,7 +25,20 @@ class Base:
             Password of dathost account.
         timeout : int, optional
             by default 60
+        max_connections : int, optional
+            Max connections kept in the client's pool, by default 100
+        keepalive_expiry : float, optional
+            Seconds an idle pooled connection is kept alive, by default 75
+        http2 : bool, optional
+            Use HTTP/2, requires h2, by default True if h2 is installed
         """
 
         self._basic_auth = BasicAuth(email, password)
         self._timeout = timeout
+        self._limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._etags = OrderedDict()
+        self._http2 = http2
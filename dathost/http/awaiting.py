@@ -1,13 +1,37 @@
-from typing import AsyncGenerator
-from .base import BaseHttp
+import asyncio
+
+from typing import Any, AsyncGenerator
+from .base import BaseHttp, ETAG_MAX_BYTES, loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Buffered listings hand control back to the event loop this often.
+YIELD_EVERY = 500
 
 
 class AwaitingHttp(BaseHttp):
     async def _get(self, url, read_bytes: bool = False,
-                   read_json: bool = True, *args, **kwargs) -> dict:
-        """Wrapped HTTPX Delete.
+                   read_json: bool = True, etag: bool = False,
+                   *args, **kwargs) -> dict:
+        """Wrapped HTTPX Get.
+
+        Parameters
+        ----------
+        etag : bool, optional
+            Sends If-None-Match with the last ETag & serves a 304
+            from the cache, by default False
         """
 
+        if etag and read_json:
+            key, cached = self._etag_request(url, kwargs)
+            return self._etag_resp(
+                key, cached, await self._client.get(url, *args, **kwargs)
+            )
+
         return self.handle_resp(
             await self._client.get(url, *args, **kwargs),
             read=read_bytes,
@@ -55,3 +79,85 @@ class AwaitingHttp(BaseHttp):
             if resp.status_code == 200:
                 async for chunk in resp.aiter_bytes():
                     yield chunk
+
+    async def _stream_json(self, url, etag: bool = False, *args, **kwargs
+                           ) -> AsyncGenerator[Any, None]:
+        """Wrapped HTTPX stream GET of a JSON array.
+
+        Parameters
+        ----------
+        etag : bool, optional
+            Sends If-None-Match with the last ETag & serves a 304
+            from the cache, by default False
+
+        Yields
+        -------
+        Any
+            Each item of the array.
+
+        Notes
+        ------
+        Items are parsed as the body arrives if ijson is installed,
+        otherwise the whole body is read first.
+
+        With etag, the raw body is buffered while streaming so a 304
+        can be served from the cache. Bodies over ETAG_MAX_BYTES stop
+        being buffered & aren't cached, keeping large listings
+        streamed.
+
+        Items already in memory are yielded with a pause every
+        YIELD_EVERY items, so large listings don't block other tasks.
+        """
+
+        if ijson is None:
+            data = await self._get(url, etag=etag, *args, **kwargs)
+            for index, item in enumerate(data, 1):
+                yield item
+                if index % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+            return
+
+        key, cached = (
+            self._etag_request(url, kwargs) if etag else (None, None)
+        )
+
+        async with self._client.stream("GET", url, *args, **kwargs) as resp:
+            if resp.status_code == 304 and cached is not None:
+                for index, item in enumerate(loads(cached), 1):
+                    yield item
+                    if index % YIELD_EVERY == 0:
+                        await asyncio.sleep(0)
+                return
+
+            if resp.status_code != 200:
+                await resp.aread()
+                self.handle_resp(resp)
+
+            resp_etag = resp.headers.get("ETag") if etag else None
+            received = [] if resp_etag else None
+            received_size = 0
+
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, "item", use_float=True)
+
+            async for chunk in resp.aiter_bytes():
+                if received is not None:
+                    received_size += len(chunk)
+                    if received_size > ETAG_MAX_BYTES:
+                        received = None
+                    else:
+                        received.append(chunk)
+
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+
+            parser.close()
+            for item in items:
+                yield item
+
+            if received is not None:
+                self._etag_store(key, resp_etag, b"".join(received))
+            elif resp_etag:
+                self._etags.pop(key, None)
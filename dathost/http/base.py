@@ -1,9 +1,14 @@
 import logging
-from typing import Any
+from typing import Any, Tuple
 
 from httpx import Response
 from json import JSONDecodeError
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 from ..exceptions import (
     NotFound,
     BadRequest,
@@ -12,7 +17,96 @@ from ..exceptions import (
 )
 
 
+# Max responses kept for conditional GETs.
+ETAG_CACHE_SIZE = 32
+# Bodies larger than this aren't kept for conditional GETs.
+ETAG_MAX_BYTES = 512 * 1024
+
+
 class BaseHttp:
+    def _etag_request(self, url: str, kwargs: dict) -> Tuple[Any, Any]:
+        """Adds If-None-Match to the request kwargs if a ETag
+           is cached for it.
+
+        Parameters
+        ----------
+        url : str
+        kwargs : dict
+            Kwargs passed to HTTPX.
+
+        Returns
+        -------
+        Any
+            Cache key of the request.
+        bytes
+            Cached body, None if nothing is cached.
+        """
+
+        params = kwargs.get("params")
+        key = (url, tuple(params.items())) if params else url
+
+        cached = self._etags.get(key)
+        if cached is None:
+            return key, None
+
+        self._etags.move_to_end(key)
+        kwargs["headers"] = {
+            **kwargs.get("headers", {}),
+            "If-None-Match": cached[0]
+        }
+
+        return key, cached[1]
+
+    def _etag_store(self, key: Any, etag: str, body: bytes) -> None:
+        """Caches a response body, evicting the least recently used
+           once over ETAG_CACHE_SIZE.
+
+        Parameters
+        ----------
+        key : Any
+            Cache key from _etag_request.
+        etag : str
+        body : bytes
+        """
+
+        if len(body) > ETAG_MAX_BYTES:
+            self._etags.pop(key, None)
+            return
+
+        self._etags[key] = (etag, body)
+        self._etags.move_to_end(key)
+
+        while len(self._etags) > ETAG_CACHE_SIZE:
+            self._etags.popitem(last=False)
+
+    def _etag_resp(self, key: Any, cached: bytes, resp: Response) -> Any:
+        """Handles a conditional JSON response.
+
+        Parameters
+        ----------
+        key : Any
+            Cache key from _etag_request.
+        cached : bytes
+            Cached body from _etag_request.
+        resp : Response
+
+        Notes
+        ------
+        Raw bodies are cached & decoded again on a 304, so callers
+        never share a mutable object.
+        """
+
+        if resp.status_code == 304 and cached is not None:
+            return loads(cached)
+
+        data = self.handle_resp(resp)
+
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etag_store(key, etag, resp.content)
+
+        return data
+
     def handle_resp(self, resp: Response, json: bool = True,
                     read: bool = True) -> Any:
         """Handles resp response.
@@ -28,14 +122,14 @@ class BaseHttp:
 
         if resp.status_code == 200:
             if json:
-                return resp.json()
+                return loads(resp.content)
             elif read:
                 return resp.read()
             else:
                 return True
         else:
             try:
-                message = resp.json()
+                message = loads(resp.content)
             except JSONDecodeError:
                 message = None
             else:
@@ -3,10 +3,23 @@ from .base import BaseHttp
 
 class BlockingHttp(BaseHttp):
     def _get(self, url, read_bytes: bool = False,
-             read_json: bool = True, *args, **kwargs) -> dict:
-        """Wrapped HTTPX Delete.
+             read_json: bool = True, etag: bool = False,
+             *args, **kwargs) -> dict:
+        """Wrapped HTTPX Get.
+
+        Parameters
+        ----------
+        etag : bool, optional
+            Sends If-None-Match with the last ETag & serves a 304
+            from the cache, by default False
         """
 
+        if etag and read_json:
+            key, cached = self._etag_request(url, kwargs)
+            return self._etag_resp(
+                key, cached, self._client.get(url, *args, **kwargs)
+            )
+
         return self.handle_resp(
             self._client.get(url, *args, **kwargs),
             json=read_json,
@@ -10,6 +10,8 @@ class BackupModel:
     timestamp : datetime.datetime
     """
 
+    __slots__ = ("backup_name", "timestamp")
+
     def __init__(self, data: dict) -> None:
         self.backup_name = data["name"]
         self.timestamp = datetime.strptime(
@@ -7,6 +7,8 @@ class FileModel:
     size : str, optional
     """
 
+    __slots__ = ("path", "size")
+
     def __init__(self, data: dict) -> None:
         self.path = data["path"]
         self.size = data.get("size")
@@ -46,6 +46,8 @@ class PlayersOnlineGraphModel:
 
 
 class MetricsModel:
+    __slots__ = ("__data",)
+
     def __init__(self, data: dict) -> None:
         self.__data = data
 
@@ -194,6 +194,51 @@ class ServerModel:
     prefer_dedicated : bool
     """
 
+    __slots__ = (
+        "server_id",
+        "name",
+        "user_data",
+        "match_id",
+        "game",
+        "location",
+        "players_online",
+        "status",
+        "booting",
+        "server_error",
+        "ip",
+        "raw_ip",
+        "on",
+        "ports",
+        "confirmed",
+        "reboot_on_crash",
+        "max_disk_usage_gb",
+        "core_dump",
+        "cost_per_hour",
+        "max_cost_per_hour",
+        "month_credits",
+        "month_reset_at",
+        "max_cost_per_month",
+        "subscription_cycle_months",
+        "subscription_renewal_failed_attempts",
+        "mysql",
+        "autostop",
+        "autostop_minutes",
+        "mysql_username",
+        "mysql_password",
+        "ftp_password",
+        "disk_usage_bytes",
+        "default_file_locations",
+        "custom_domain",
+        "added_voice_server",
+        "duplicate_source_server",
+        "prefer_dedicated",
+        "teamspeak",
+        "teamfortress",
+        "csgo",
+        "valheim",
+        "__scheduled_commands"
+    )
+
     def __init__(self, data: dict) -> None:
         self.server_id = data["id"]
         self.name = data["name"]
@@ -1,5 +1,13 @@
-from typing import AsyncGenerator, Tuple
-from ..base import ServerBase
+from __future__ import annotations
+import asyncio
+
+from typing import Any, AsyncGenerator, List, Tuple
+from ..base import (
+    ServerBase,
+    _new_lines,
+    _CONSOLE_MIN,
+    _CONSOLE_MAX
+)
 
 from ...models.server import ServerModel
 from ...models.file import FileModel
@@ -16,10 +24,59 @@ from ...settings import ServerSettings, MatchSettings
 
 from ...exceptions import InvalidConsoleLine
 
-from ...routes import SERVER, MATCHES
+from ...routes import MATCHES
 
 
 class ServerAwaiting(ServerBase):
+    __slots__ = ()
+
+    @classmethod
+    async def bulk(cls, servers: List[ServerAwaiting], op: str, *,
+                   concurrency: int = 5, **kwargs) -> List[Any]:
+        """Used to run the same operation on many servers concurrently.
+
+        Parameters
+        ----------
+        servers : List[ServerAwaiting]
+            Servers to run the operation on.
+        op : str
+            Name of the method to call, e.g. "start" or "stop".
+        concurrency : int, optional
+            Max requests in flight at once, by default 5
+        **kwargs
+            Passed to the method.
+
+        Returns
+        -------
+        List[Any]
+            Result of each call, in the same order as servers.
+            Exceptions are returned instead of raised.
+
+        Raises
+        ------
+        ValueError
+            Raised when concurrency is below 1.
+
+        Notes
+        ------
+        Keep concurrency modest, large values mostly queue on the
+        client's connection pool and increase tail latency.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(server: ServerAwaiting) -> Any:
+            async with semaphore:
+                return await getattr(server, op)(**kwargs)
+
+        return await asyncio.gather(
+            *[run(server) for server in servers],
+            return_exceptions=True
+        )
+
     async def create_match(self, match_settings: MatchSettings,
                            ) -> Tuple[MatchModel, AwaitingMatch]:
         """Creates a match.
@@ -39,10 +96,14 @@ class ServerAwaiting(ServerBase):
 
         data = await self._context._post(
             MATCHES.create,
-            data={"game_server_id": self.server_id, **match_settings.payload},
+            data=dict(
+                match_settings.payload, game_server_id=self.server_id
+            ),
             read_json=True
         )
 
+        self.invalidate()
+
         return MatchModel(data), AwaitingMatch(self._context, data["id"])
 
     async def delete(self) -> None:
@@ -50,9 +111,11 @@ class ServerAwaiting(ServerBase):
         """
 
         await self._context._delete(
-            SERVER.delete.format(self.server_id),
+            self._url_delete,
         )
 
+        self.invalidate()
+
     async def get(self) -> ServerModel:
         """Used to get details on server.
 
@@ -62,9 +125,13 @@ class ServerAwaiting(ServerBase):
             Holds data on server.
         """
 
-        return ServerModel(
-            await self._context._get(SERVER.get.format(self.server_id))
-        )
+        server = self._cache_get("get", self.meta_ttl)
+        if server is None:
+            server = self._cache_set("get", ServerModel(
+                await self._context._get(self._url_get, etag=True)
+            ))
+
+        return server
 
     async def update(self, settings: ServerSettings) -> None:
         """Update servers paramters.
@@ -76,13 +143,12 @@ class ServerAwaiting(ServerBase):
         """
 
         await self._context._put(
-            SERVER.update.format(self.server_id),
-            data={
-                **settings.payload,
-                "server_id": self.server_id
-            }
+            self._url_update,
+            data=dict(settings.payload, server_id=self.server_id)
         )
 
+        self.invalidate()
+
     async def console_send(self, line: str) -> None:
         """Used to send a rcon command to console.
 
@@ -92,20 +158,52 @@ class ServerAwaiting(ServerBase):
             Console command.
         """
 
+        await self.console_send_many([line])
+
+    async def console_send_many(self, lines: List[str]) -> None:
+        """Used to send multiple commands to console in one request.
+
+        Parameters
+        ----------
+        lines : List[str]
+            Console commands, nothing is sent if empty.
+
+        Raises
+        ------
+        ValueError
+            Raised when a command contains a newline.
+
+        Notes
+        ------
+        Commands are joined with newlines into the single line field,
+        the console reads each newline separated command as its own
+        input, the same as entering them one after another.
+        """
+
+        if not lines:
+            return
+
+        if any("\n" in line for line in lines):
+            raise ValueError("console commands can't contain newlines")
+
         await self._context._post(
-            url=SERVER.console.format(self.server_id),
+            url=self._url_console,
             data={
-                "line": line,
+                "line": "\n".join(lines),
             }
         )
 
-    async def console_retrive(self, lines: int = 1000) -> list:
+    async def console_retrive(self, lines: int = 1000, *,
+                              clamp: bool = False) -> list:
         """Used to retrive lines from the console.
 
         Parameters
         ----------
         lines : int, optional
             Amount of lines to retrive, by default 1000
+        clamp : bool, optional
+            Clamp lines between 1 and 100000 instead of raising,
+            by default False
 
         Returns
         -------
@@ -115,14 +213,20 @@ class ServerAwaiting(ServerBase):
         Raises
         ------
         InvalidConsoleLine
-            Raised when console lines below 1 or above 100000.
+            Raised when console lines below 1 or above 100000
+            and clamp is False.
         """
 
-        if lines < 1 or lines > 100000:
+        if clamp:
+            lines = (
+                _CONSOLE_MAX if lines > _CONSOLE_MAX
+                else _CONSOLE_MIN if lines < _CONSOLE_MIN else lines
+            )
+        elif lines < _CONSOLE_MIN or lines > _CONSOLE_MAX:
             raise InvalidConsoleLine()
 
         data = await self._context._get(
-            url=SERVER.console.format(self.server_id),
+            url=self._url_console,
             params={
                 "max_lines": lines,
             },
@@ -130,12 +234,48 @@ class ServerAwaiting(ServerBase):
 
         return data["lines"]
 
+    async def console_tail(self, lines: int = 1000, interval: float = 1.0
+                           ) -> AsyncGenerator[str, None]:
+        """Used to follow the console, yielding new lines as they appear.
+
+        Parameters
+        ----------
+        lines : int, optional
+            Amount of lines to retrive per poll, by default 1000
+        interval : float, optional
+            Seconds between polls, by default 1.0
+
+        Yields
+        -------
+        str
+            Console line.
+
+        Notes
+        ------
+        The current console is yielded first, after that only lines
+        not seen in the previous poll are yielded.
+
+        New lines are found by matching the end of the previous poll
+        against the start of the current one, so lines identical to
+        the ones before them can be missed, e.g. a repeated line
+        arriving once the window is full of that same line.
+        """
+
+        previous = []
+        while True:
+            current = await self.console_retrive(lines)
+            for line in _new_lines(previous, current):
+                yield line
+
+            previous = current
+            await asyncio.sleep(interval)
+
     async def sync(self) -> None:
         """Used to sync files from server to cache.
         """
 
         await self._context._post(
-            url=SERVER.sync.format(self.server_id)
+            url=self._url_sync
         )
 
     async def duplicate(self, sync: bool = False,
@@ -159,7 +299,7 @@ class ServerAwaiting(ServerBase):
             await self.sync()
 
         data = await self._context._post(
-            url=SERVER.duplicate.format(self.server_id),
+            url=self._url_duplicate,
             read_json=True,
         )
 
@@ -170,17 +310,21 @@ class ServerAwaiting(ServerBase):
         """
 
         await self._context._post(
-            url=SERVER.ftp.format(self.server_id)
+            url=self._url_ftp
         )
 
+        self.invalidate()
+
     async def stop(self) -> None:
         """Used to stop the server.
         """
 
         await self._context._post(
-            url=SERVER.stop.format(self.server_id),
+            url=self._url_stop,
         )
 
+        self.invalidate()
+
     async def start(self, allow_host_reassignment: bool = True) -> None:
         """Used to start the server.
 
@@ -191,18 +335,22 @@ class ServerAwaiting(ServerBase):
         """
 
         await self._context._post(
-            url=SERVER.start.format(self.server_id),
+            url=self._url_start,
             data={"allow_host_reassignment": allow_host_reassignment}
         )
 
+        self.invalidate()
+
     async def reset(self) -> None:
         """Used to reset the server.
         """
 
         await self._context._post(
-            url=SERVER.reset.format(self.server_id),
+            url=self._url_reset,
         )
 
+        self.invalidate()
+
     async def files(self, hide_default: bool = False, path: str = None,
                     file_sizes: bool = False,
                     deleted_files: bool = False
@@ -226,18 +374,21 @@ class ServerAwaiting(ServerBase):
             Holds details on a file.
         """
 
-        data = await self._context._get(
-            SERVER.files.format(self.server_id),
-            params={
-                "hide_default_files": hide_default,
-                "path": path,
-                "with_filesizes": file_sizes,
-                "include_deleted_files": deleted_files
-            },
-        )
-
-        for file_ in data:
-            yield FileModel(file_), self.file(file_["path"])
+        context = self._context
+        server_id = self.server_id
+
+        async for file_ in context._stream_json(
+                self._url_files,
+                etag=True,
+                params={
+                    "hide_default_files": hide_default,
+                    "path": path,
+                    "with_filesizes": file_sizes,
+                    "include_deleted_files": deleted_files
+                }):
+            yield FileModel(file_), AwaitingFile(
+                context, server_id, file_["path"]
+            )
 
     def file(self, pathway: str) -> AwaitingFile:
         """Used to interact with a file on the server.
@@ -270,12 +421,14 @@ class ServerAwaiting(ServerBase):
             Used for interacting with a backup.
         """
 
-        data = await self._context._get(
-            SERVER.backups.format(self.server_id),
-        )
+        context = self._context
+        server_id = self.server_id
 
-        for backup in data:
-            yield BackupModel(backup), self.backup(backup["name"])
+        async for backup in context._stream_json(
+                self._url_backups, etag=True):
+            yield BackupModel(backup), AwaitingBackup(
+                context, server_id, backup["name"]
+            )
 
     def backup(self, backup_name: str) -> AwaitingBackup:
         """Used to interact with a backup.
@@ -305,8 +458,10 @@ class ServerAwaiting(ServerBase):
             Holds details on server metrics.
         """
 
-        data = await self._context._get(
-            SERVER.metrics.format(self.server_id)
-        )
+        metrics = self._cache_get("metrics", self.metrics_ttl)
+        if metrics is None:
+            metrics = self._cache_set("metrics", MetricsModel(
+                await self._context._get(self._url_metrics)
+            ))
 
-        return MetricsModel(data)
+        return metrics
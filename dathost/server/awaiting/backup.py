@@ -4,6 +4,8 @@ from ...routes import SERVER
 
 
 class AwaitingBackup(BackupBase):
+    __slots__ = ()
+
     async def restore(self) -> None:
         """Used to restore a backup.
         """
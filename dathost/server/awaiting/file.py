@@ -7,6 +7,8 @@ from ..base import FileBase
 
 
 class AwaitingFile(FileBase):
+    __slots__ = ()
+
     async def delete(self) -> None:
         """Deletes file.
         """
@@ -1,5 +1,66 @@
+from time import monotonic
+from typing import Any, Dict, List, Tuple
+
+from ..routes import SERVER
+
+
+_CONSOLE_MIN, _CONSOLE_MAX = 1, 100000
+
+
+def _new_lines(previous: List[str], current: List[str]) -> List[str]:
+    """Returns the lines of current which come after previous.
+
+    Notes
+    ------
+    The overlap is the longest start of current which is also the end
+    of previous, found in linear time with a KMP prefix function.
+    """
+
+    # Window not full yet, or nothing new.
+    if current[:len(previous)] == previous:
+        return current[len(previous):]
+
+    # The sentinel stops a match running from current into previous.
+    sequence = current + [object()] + previous
+    prefix = [0] * len(sequence)
+
+    for index in range(1, len(sequence)):
+        matched = prefix[index - 1]
+        while matched and sequence[index] != sequence[matched]:
+            matched = prefix[matched - 1]
+
+        if sequence[index] == sequence[matched]:
+            matched += 1
+
+        prefix[index] = matched
+
+    return current[prefix[-1]:]
+
+
 class ServerBase:
-    def __init__(self, context: object, server_id: str) -> None:
+    __slots__ = (
+        "_context",
+        "server_id",
+        "meta_ttl",
+        "metrics_ttl",
+        "_meta_cache",
+        "_url_delete",
+        "_url_get",
+        "_url_update",
+        "_url_console",
+        "_url_sync",
+        "_url_duplicate",
+        "_url_ftp",
+        "_url_stop",
+        "_url_start",
+        "_url_reset",
+        "_url_files",
+        "_url_backups",
+        "_url_metrics"
+    )
+
+    def __init__(self, context: object, server_id: str,
+                 meta_ttl: float = 1.0, metrics_ttl: float = 0.5) -> None:
         """Used to interact with a server.
 
         Parameters
@@ -8,13 +69,54 @@ class ServerBase:
             Context of the client.
         server_id : str
             Dathost server ID.
+        meta_ttl : float, optional
+            Seconds get() results are cached for, by default 1.0
+        metrics_ttl : float, optional
+            Seconds metrics() results are cached for, by default 0.5
         """
 
         self._context = context
         self.server_id = server_id
+        self.meta_ttl = meta_ttl
+        self.metrics_ttl = metrics_ttl
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
+
+        self._url_delete = SERVER.delete.format(server_id)
+        self._url_get = SERVER.get.format(server_id)
+        self._url_update = SERVER.update.format(server_id)
+        self._url_console = SERVER.console.format(server_id)
+        self._url_sync = SERVER.sync.format(server_id)
+        self._url_duplicate = SERVER.duplicate.format(server_id)
+        self._url_ftp = SERVER.ftp.format(server_id)
+        self._url_stop = SERVER.stop.format(server_id)
+        self._url_start = SERVER.start.format(server_id)
+        self._url_reset = SERVER.reset.format(server_id)
+        self._url_files = SERVER.files.format(server_id)
+        self._url_backups = SERVER.backups.format(server_id)
+        self._url_metrics = SERVER.metrics.format(server_id)
+
+    def _cache_get(self, key: str, ttl: float) -> Any:
+        if key in self._meta_cache:
+            timestamp, value = self._meta_cache[key]
+            if monotonic() - timestamp < ttl:
+                return value
+
+        return None
+
+    def _cache_set(self, key: str, value: Any) -> Any:
+        self._meta_cache[key] = (monotonic(), value)
+        return value
+
+    def invalidate(self) -> None:
+        """Clears cached server details & metrics.
+        """
+
+        self._meta_cache.clear()
 
 
 class FileBase:
+    __slots__ = ("_context", "server_id", "file_path")
+
     def __init__(self, context: object,
                  server_id: str, file_path: str) -> None:
         self._context = context
@@ -23,6 +125,8 @@ class FileBase:
 
 
 class BackupBase:
+    __slots__ = ("_context", "server_id", "backup_name")
+
     def __init__(self, context: object, server_id: str,
                  backup_name: str) -> None:
 
@@ -1,5 +1,11 @@
-from typing import Generator, Tuple
-from ..base import ServerBase
+from time import sleep
+from typing import Generator, List, Tuple
+from ..base import (
+    ServerBase,
+    _new_lines,
+    _CONSOLE_MIN,
+    _CONSOLE_MAX
+)
 
 from ...models.server import ServerModel
 from ...models.file import FileModel
@@ -16,10 +22,12 @@ from ...settings import ServerSettings, MatchSettings
 
 from ...exceptions import InvalidConsoleLine
 
-from ...routes import SERVER, MATCHES
+from ...routes import MATCHES
 
 
 class ServerBlocking(ServerBase):
+    __slots__ = ()
+
     def create_match(self, match_settings: MatchSettings,
                      ) -> Tuple[MatchModel, BlockingMatch]:
         """Creates a match.
@@ -39,10 +47,14 @@ class ServerBlocking(ServerBase):
 
         data = self._context._post(
             MATCHES.create,
-            data={"game_server_id": self.server_id, **match_settings.payload},
+            data=dict(
+                match_settings.payload, game_server_id=self.server_id
+            ),
             read_json=True
         )
 
+        self.invalidate()
+
         return MatchModel(data), BlockingMatch(self._context, data["id"])
 
     def delete(self) -> None:
@@ -50,9 +62,11 @@ class ServerBlocking(ServerBase):
         """
 
         self._context._delete(
-            SERVER.delete.format(self.server_id),
+            self._url_delete,
         )
 
+        self.invalidate()
+
     def get(self) -> ServerModel:
         """Used to get details on server.
 
@@ -62,9 +76,13 @@ class ServerBlocking(ServerBase):
             Holds data on server.
         """
 
-        return ServerModel(
-            self._context._get(SERVER.get.format(self.server_id))
-        )
+        server = self._cache_get("get", self.meta_ttl)
+        if server is None:
+            server = self._cache_set("get", ServerModel(
+                self._context._get(self._url_get, etag=True)
+            ))
+
+        return server
 
     def update(self, settings: ServerSettings) -> None:
         """Update servers paramters.
@@ -76,13 +94,12 @@ class ServerBlocking(ServerBase):
         """
 
         self._context._put(
-            SERVER.update.format(self.server_id),
-            data={
-                **settings.payload,
-                "server_id": self.server_id
-            }
+            self._url_update,
+            data=dict(settings.payload, server_id=self.server_id)
         )
 
+        self.invalidate()
+
     def console_send(self, line: str) -> None:
         """Used to send a command to console.
 
@@ -92,20 +109,52 @@ class ServerBlocking(ServerBase):
             Console command.
         """
 
+        self.console_send_many([line])
+
+    def console_send_many(self, lines: List[str]) -> None:
+        """Used to send multiple commands to console in one request.
+
+        Parameters
+        ----------
+        lines : List[str]
+            Console commands, nothing is sent if empty.
+
+        Raises
+        ------
+        ValueError
+            Raised when a command contains a newline.
+
+        Notes
+        ------
+        Commands are joined with newlines into the single line field,
+        the console reads each newline separated command as its own
+        input, the same as entering them one after another.
+        """
+
+        if not lines:
+            return
+
+        if any("\n" in line for line in lines):
+            raise ValueError("console commands can't contain newlines")
+
         self._context._post(
-            url=SERVER.console.format(self.server_id),
+            url=self._url_console,
             data={
-                "line": line,
+                "line": "\n".join(lines),
             }
         )
 
-    def console_retrive(self, lines: int = 1000) -> list:
+    def console_retrive(self, lines: int = 1000, *,
+                        clamp: bool = False) -> list:
         """Used to retrive lines from the console.
 
         Parameters
         ----------
         lines : int, optional
             Amount of lines to retrive, by default 1000
+        clamp : bool, optional
+            Clamp lines between 1 and 100000 instead of raising,
+            by default False
 
         Returns
         -------
@@ -115,13 +164,19 @@ class ServerBlocking(ServerBase):
         Raises
         ------
         InvalidConsoleLine
-            Raised when console lines below 1 or above 100000.
+            Raised when console lines below 1 or above 100000
+            and clamp is False.
         """
-        if lines < 1 or lines > 100000:
+        if clamp:
+            lines = (
+                _CONSOLE_MAX if lines > _CONSOLE_MAX
+                else _CONSOLE_MIN if lines < _CONSOLE_MIN else lines
+            )
+        elif lines < _CONSOLE_MIN or lines > _CONSOLE_MAX:
             raise InvalidConsoleLine()
 
         data = self._context._get(
-            url=SERVER.console.format(self.server_id),
+            url=self._url_console,
             params={
                 "max_lines": lines,
             },
@@ -129,12 +184,48 @@ class ServerBlocking(ServerBase):
 
         return data["lines"]
 
+    def console_tail(self, lines: int = 1000, interval: float = 1.0
+                     ) -> Generator[str, None, None]:
+        """Used to follow the console, yielding new lines as they appear.
+
+        Parameters
+        ----------
+        lines : int, optional
+            Amount of lines to retrive per poll, by default 1000
+        interval : float, optional
+            Seconds between polls, by default 1.0
+
+        Yields
+        -------
+        str
+            Console line.
+
+        Notes
+        ------
+        The current console is yielded first, after that only lines
+        not seen in the previous poll are yielded.
+
+        New lines are found by matching the end of the previous poll
+        against the start of the current one, so lines identical to
+        the ones before them can be missed, e.g. a repeated line
+        arriving once the window is full of that same line.
+        """
+
+        previous = []
+        while True:
+            current = self.console_retrive(lines)
+            for line in _new_lines(previous, current):
+                yield line
+
+            previous = current
+            sleep(interval)
+
     def sync(self) -> None:
         """Used to sync files from server to cache.
         """
 
         self._context._post(
-            url=SERVER.sync.format(self.server_id)
+            url=self._url_sync
         )
 
     def duplicate(self, sync: bool = False,
@@ -158,7 +249,7 @@ class ServerBlocking(ServerBase):
             self.sync()
 
         data = self._context._post(
-            url=SERVER.duplicate.format(self.server_id),
+            url=self._url_duplicate,
             read_json=True,
         )
 
@@ -169,17 +260,21 @@ class ServerBlocking(ServerBase):
         """
 
         self._context._post(
-            url=SERVER.ftp.format(self.server_id)
+            url=self._url_ftp
         )
 
+        self.invalidate()
+
     def stop(self) -> None:
         """Used to stop the server.
         """
 
         self._context._post(
-            url=SERVER.stop.format(self.server_id),
+            url=self._url_stop,
         )
 
+        self.invalidate()
+
     def start(self, allow_host_reassignment: bool = True) -> None:
         """Used to stop the server.
 
@@ -190,18 +285,22 @@ class ServerBlocking(ServerBase):
         """
 
         self._context._post(
-            url=SERVER.start.format(self.server_id),
+            url=self._url_start,
             data={"allow_host_reassignment": allow_host_reassignment}
         )
 
+        self.invalidate()
+
     def reset(self) -> None:
         """Used to reset the server.
         """
 
         self._context._post(
-            url=SERVER.reset.format(self.server_id),
+            url=self._url_reset,
         )
 
+        self.invalidate()
+
     def files(self, hide_default: bool = False, path: str = None,
               file_sizes: bool = False,
               deleted_files: bool = False
@@ -226,7 +325,8 @@ class ServerBlocking(ServerBase):
         """
 
         data = self._context._get(
-            SERVER.files.format(self.server_id),
+            self._url_files,
+            etag=True,
             params={
                 "hide_default_files": hide_default,
                 "path": path,
@@ -235,8 +335,13 @@ class ServerBlocking(ServerBase):
             },
         )
 
+        context = self._context
+        server_id = self.server_id
+
         for file_ in data:
-            yield FileModel(file_), self.file(file_["path"])
+            yield FileModel(file_), BlockingFile(
+                context, server_id, file_["path"]
+            )
 
     def file(self, pathway: str) -> BlockingFile:
         """Used to interact with a file on the server.
@@ -270,11 +375,17 @@ class ServerBlocking(ServerBase):
         """
 
         data = self._context._get(
-            SERVER.backups.format(self.server_id),
+            self._url_backups,
+            etag=True
         )
 
+        context = self._context
+        server_id = self.server_id
+
         for backup in data:
-            yield BackupModel(backup), self.backup(backup["name"])
+            yield BackupModel(backup), BlockingBackup(
+                context, server_id, backup["name"]
+            )
 
     def backup(self, backup_name: str) -> BlockingBackup:
         """Used to interact with a backup.
@@ -304,8 +415,10 @@ class ServerBlocking(ServerBase):
             Holds details on server metrics.
         """
 
-        data = self._context._get(
-            SERVER.metrics.format(self.server_id)
-        )
+        metrics = self._cache_get("metrics", self.metrics_ttl)
+        if metrics is None:
+            metrics = self._cache_set("metrics", MetricsModel(
+                self._context._get(self._url_metrics)
+            ))
 
-        return MetricsModel(data)
+        return metrics
@@ -4,6 +4,8 @@ from ...routes import SERVER
 
 
 class BlockingBackup(BackupBase):
+    __slots__ = ()
+
     def restore(self) -> None:
         """Used to restore a backup.
         """
@@ -6,6 +6,8 @@ from ...exceptions import AwaitingOnly
 
 
 class BlockingFile(FileBase):
+    __slots__ = ()
+
     def delete(self) -> None:
         """Deletes file.
         """
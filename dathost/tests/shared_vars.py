@@ -4,3 +4,71 @@ TEST_IMAGE_DIRETORY = os.path.join(
     os.path.dirname(os.path.realpath(__file__)),
     "test.jpg"
 )
+
+SERVER_DATA = {
+    "id": "test",
+    "name": "Test server",
+    "user_data": None,
+    "match_id": None,
+    "game": "csgo",
+    "location": "sydney",
+    "players_online": 0,
+    "status": [],
+    "booting": False,
+    "server_error": None,
+    "ip": "127.0.0.1",
+    "raw_ip": "127.0.0.1",
+    "on": False,
+    "ports": {"game": 27015, "gotv": 27020},
+    "confirmed": True,
+    "reboot_on_crash": True,
+    "max_disk_usage_gb": 30,
+    "enable_core_dump": False,
+    "cost_per_hour": 0,
+    "max_cost_per_hour": 0,
+    "month_credits": 0.0,
+    "month_reset_at": 0,
+    "max_cost_per_month": 0.0,
+    "subscription_cycle_months": 0,
+    "subscription_renewal_failed_attempts": 0,
+    "enable_mysql": False,
+    "autostop": False,
+    "autostop_minutes": 0,
+    "mysql_username": None,
+    "mysql_password": None,
+    "ftp_password": None,
+    "disk_usage_bytes": 0,
+    "default_file_locations": [],
+    "custom_domain": None,
+    "added_voice_server": None,
+    "duplicate_source_server": None,
+    "prefer_dedicated": False,
+    "teamspeak3_settings": None,
+    "teamfortress2_settings": None,
+    "csgo_settings": None,
+    "valheim_settings": None,
+    "scheduled_commands": []
+}
+
+MATCH_DATA = {
+    "id": "match",
+    "game_server_id": "test",
+    "connect_time": 300,
+    "round_end_webhook_url": None,
+    "match_end_webhook_url": None,
+    "finished": False,
+    "cancel_reason": None,
+    "rounds_played": 0,
+    "spectator_steam_ids": [],
+    "enable_knife_round": False,
+    "enable_playwin": False,
+    "playwin_result_webhook_url": None,
+    "playwin_result": None,
+    "warmup_time": 15,
+    "wait_for_spectators": False,
+    "team1_steam_ids": [],
+    "team1_stats": {"score": 0},
+    "team2_steam_ids": [],
+    "team2_stats": {"score": 0},
+    "player_stats": []
+}
@@ -1,3 +1,4 @@
+import asyncio
 import asynctest
 
 from secrets import token_urlsafe
@@ -85,9 +86,22 @@ class TestAwaitingClient(asynctest.TestCase):
         self.assertIsInstance(await server.get(), ServerModel)
 
         await server.console_send("status")
+        await server.console_send_many(["status", "users"])
         await server.console_retrive()
+        await server.console_retrive(lines=0, clamp=True)
 
         await server.start()
+
+        # Output lines, not the echoed input, prove both commands ran.
+        await server.console_send_many(["echo dathost_one", "echo dathost_two"])
+        await asyncio.sleep(5)
+        console = [line.strip() for line in await server.console_retrive()]
+        self.assertIn("dathost_one", console)
+        self.assertIn("dathost_two", console)
+
+        with self.assertRaises(ValueError):
+            await server.console_send_many(["status\nusers"])
+
         await server.stop()
         await server.reset()
 
@@ -148,6 +162,11 @@ class TestAwaitingClient(asynctest.TestCase):
 
         self.assertIsNone(await test_2_file.delete())
 
+        self.assertEqual(await ServerAwaiting.bulk([server], "sync"), [None])
+
+        with self.assertRaises(ValueError):
+            await ServerAwaiting.bulk([server], "sync", concurrency=0)
+
         _, duplicate = await server.duplicate(sync=True)
         self.assertIsNone(await duplicate.delete())
 
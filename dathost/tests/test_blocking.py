@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from secrets import token_urlsafe
@@ -83,9 +84,22 @@ class TestBlockingClient(unittest.TestCase):
         self.assertIsInstance(server.get(), ServerModel)
 
         server.console_send("status")
+        server.console_send_many(["status", "users"])
         server.console_retrive()
+        server.console_retrive(lines=0, clamp=True)
 
         server.start()
+
+        # Output lines, not the echoed input, prove both commands ran.
+        server.console_send_many(["echo dathost_one", "echo dathost_two"])
+        time.sleep(5)
+        console = [line.strip() for line in server.console_retrive()]
+        self.assertIn("dathost_one", console)
+        self.assertIn("dathost_two", console)
+
+        with self.assertRaises(ValueError):
+            server.console_send_many(["status\nusers"])
+
         server.stop()
         server.reset()
 
@@ -0,0 +1,109 @@
+import asyncio
+import time
+import unittest
+
+from ..server.base import _new_lines, _CONSOLE_MAX
+from ..server.awaiting import ServerAwaiting
+from ..server.blocking import ServerBlocking
+
+
+POLLS = [
+    ["a", "b", "c"],
+    ["b", "c", "d"],
+    ["b", "c", "d"],
+    ["boot"],
+]
+
+
+class AwaitingConsole(ServerAwaiting):
+    __slots__ = ("polls",)
+
+    async def console_retrive(self, lines: int = 1000, *,
+                              clamp: bool = False) -> list:
+        return self.polls.pop(0)
+
+
+class BlockingConsole(ServerBlocking):
+    __slots__ = ("polls",)
+
+    def console_retrive(self, lines: int = 1000, *,
+                        clamp: bool = False) -> list:
+        return self.polls.pop(0)
+
+
+class TestConsoleLines(unittest.TestCase):
+    def test_new_lines_empty_previous(self):
+        self.assertEqual(_new_lines([], ["a", "b"]), ["a", "b"])
+
+    def test_new_lines_unchanged(self):
+        self.assertEqual(_new_lines(["a", "b"], ["a", "b"]), [])
+
+    def test_new_lines_full_window(self):
+        self.assertEqual(
+            _new_lines(["a", "b", "c"], ["b", "c", "d", "e"]), ["d", "e"]
+        )
+
+    def test_new_lines_restarted(self):
+        self.assertEqual(
+            _new_lines(["a", "b", "c"], ["boot", "ready"]),
+            ["boot", "ready"]
+        )
+
+    def test_new_lines_repeated(self):
+        self.assertEqual(_new_lines(["x", "x"], ["x", "x", "x"]), ["x"])
+
+        # Known limitation, a repeated line is missed once the
+        # window is full of it.
+        self.assertEqual(_new_lines(["x", "x"], ["x", "x"]), [])
+
+    def test_new_lines_max_window(self):
+        previous = [str(index) for index in range(_CONSOLE_MAX)]
+        new = ["new {}".format(index) for index in range(200)]
+        restarted = ["boot {}".format(index) for index in range(_CONSOLE_MAX)]
+
+        started = time.perf_counter()
+
+        self.assertEqual(_new_lines(previous, previous[200:] + new), new)
+        self.assertEqual(_new_lines(previous, restarted), restarted)
+
+        # Linear, a quadratic search takes tens of seconds here.
+        self.assertLess(time.perf_counter() - started, 2)
+
+    def test_send_many_validation(self):
+        # No context, so these raise if a request is attempted.
+        server = ServerBlocking(None, "test")
+        server.console_send_many([])
+        with self.assertRaises(ValueError):
+            server.console_send_many(["status\nusers"])
+
+        server = ServerAwaiting(None, "test")
+        asyncio.run(server.console_send_many([]))
+        with self.assertRaises(ValueError):
+            asyncio.run(server.console_send_many(["status\nusers"]))
+
+    def test_awaiting_console_tail(self):
+        server = AwaitingConsole(None, "test")
+        server.polls = list(POLLS)
+
+        async def tail():
+            lines = []
+            async for line in server.console_tail(interval=0):
+                lines.append(line)
+                if line == "boot":
+                    return lines
+
+        self.assertEqual(
+            asyncio.run(tail()), ["a", "b", "c", "d", "boot"]
+        )
+
+    def test_blocking_console_tail(self):
+        server = BlockingConsole(None, "test")
+        server.polls = list(POLLS)
+
+        lines = []
+        for line in server.console_tail(interval=0):
+            lines.append(line)
+            if line == "boot":
+                break
+
+        self.assertEqual(lines, ["a", "b", "c", "d", "boot"])
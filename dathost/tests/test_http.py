@@ -0,0 +1,285 @@
+import asyncio
+import json
+import time
+import unittest
+
+from unittest import mock
+
+from httpx import AsyncClient, Client, MockTransport, Response
+
+from .shared_vars import SERVER_DATA, MATCH_DATA
+
+from ..http.base import ETAG_CACHE_SIZE, ETAG_MAX_BYTES
+from ..http.awaiting import ijson
+
+from ..models.server import ServerModel
+from ..models.metrics import MetricsModel
+
+from ..settings import ServerSettings, MatchSettings
+
+from ..exceptions import NotFound
+
+from .. import Awaiting, Blocking
+
+
+class TestEtagCache(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+
+        self.client = Blocking("", "")
+        self.client._client.close()
+        self.client._client = Client(
+            transport=MockTransport(self.handler)
+        )
+
+    def tearDown(self):
+        self.client.close()
+
+    def handler(self, request):
+        self.requests.append(request)
+
+        body = b'{"lines": ["a", "b"]}'
+        if request.url.path.endswith("/big"):
+            body = b'"' + b"a" * ETAG_MAX_BYTES + b'"'
+
+        if request.headers.get("If-None-Match") == '"v1"':
+            return Response(304)
+
+        return Response(200, content=body, headers={"ETag": '"v1"'})
+
+    def test_etag_not_modified(self):
+        first = self.client._get("https://test/a", etag=True)
+        second = self.client._get("https://test/a", etag=True)
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            self.requests[1].headers.get("If-None-Match"), '"v1"'
+        )
+
+    def test_etag_copy(self):
+        data = self.client._get("https://test/a", etag=True)
+        data["lines"].append("mutated")
+
+        self.assertEqual(
+            self.client._get("https://test/a", etag=True),
+            {"lines": ["a", "b"]}
+        )
+
+    def test_etag_opt_in(self):
+        self.client._get("https://test/a")
+        self.client._get("https://test/a")
+
+        self.assertEqual(len(self.client._etags), 0)
+        self.assertIsNone(self.requests[1].headers.get("If-None-Match"))
+
+    def test_etag_bounded(self):
+        for index in range(ETAG_CACHE_SIZE + 5):
+            self.client._get(
+                "https://test/a", etag=True, params={"index": index}
+            )
+
+        self.assertEqual(len(self.client._etags), ETAG_CACHE_SIZE)
+        self.assertNotIn(
+            ("https://test/a", (("index", 0),)), self.client._etags
+        )
+
+    def test_etag_max_bytes(self):
+        self.client._get("https://test/big", etag=True)
+
+        self.assertEqual(len(self.client._etags), 0)
+
+
+class TestServerCache(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+
+        self.client = Blocking("", "")
+        self.client._client.close()
+        self.client._client = Client(
+            transport=MockTransport(self.handler)
+        )
+
+    def tearDown(self):
+        self.client.close()
+
+    def handler(self, request):
+        self.requests.append((request.method, request.url.path))
+
+        if request.url.path.endswith("/matches"):
+            return Response(200, content=json.dumps(MATCH_DATA).encode())
+
+        if request.method != "GET":
+            return Response(200)
+
+        if request.url.path.endswith("/metrics"):
+            return Response(200, content=b'{"maps_played": []}')
+
+        return Response(200, content=json.dumps(SERVER_DATA).encode())
+
+    def gets(self):
+        return [request for request in self.requests if request[0] == "GET"]
+
+    def test_get_cached(self):
+        server = self.client.server("test")
+
+        first = server.get()
+        self.assertIsInstance(first, ServerModel)
+        self.assertIs(server.get(), first)
+        self.assertEqual(len(self.gets()), 1)
+
+    def test_metrics_cached(self):
+        server = self.client.server("test")
+
+        self.assertIsInstance(server.metrics(), MetricsModel)
+        server.metrics()
+        self.assertEqual(len(self.gets()), 1)
+
+    def test_ttl_disabled(self):
+        server = self.client.server("test", meta_ttl=0, metrics_ttl=0)
+
+        server.get()
+        server.get()
+        server.metrics()
+        server.metrics()
+        self.assertEqual(len(self.gets()), 4)
+
+    def test_ttl_expired(self):
+        server = self.client.server("test", meta_ttl=0.05)
+
+        server.get()
+        time.sleep(0.1)
+        server.get()
+        self.assertEqual(len(self.gets()), 2)
+
+    def test_invalidate(self):
+        server = self.client.server("test")
+
+        server.get()
+        server.invalidate()
+        server.get()
+        self.assertEqual(len(self.gets()), 2)
+
+    def test_invalidated_by_changes(self):
+        server = self.client.server("test")
+
+        changes = [
+            server.stop,
+            server.start,
+            server.reset,
+            server.ftp_reset,
+            lambda: server.update(ServerSettings(name="Renamed")),
+            lambda: server.create_match(MatchSettings()),
+        ]
+
+        for index, change in enumerate(changes, 2):
+            server.get()
+            change()
+            server.get()
+            self.assertEqual(len(self.gets()), index)
+
+
+class TestStreamJson(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.headers = []
+        self.bodies = {}
+
+        self.client = Awaiting("", "")
+        asyncio.run(self.client._client.aclose())
+        self.client._client = AsyncClient(
+            transport=MockTransport(self.handler)
+        )
+
+    def tearDown(self):
+        asyncio.run(self.client.close())
+
+    def handler(self, request):
+        self.headers.append(request.headers.get("If-None-Match"))
+
+        chunks, etag = self.bodies[request.url.path]
+        if chunks is None:
+            return Response(404)
+        if etag and request.headers.get("If-None-Match") == etag:
+            return Response(304)
+
+        async def stream():
+            for chunk in chunks:
+                self.log.append(chunk)
+                yield chunk
+
+        return Response(
+            200, content=stream(), headers={"ETag": etag} if etag else {}
+        )
+
+    def stream(self, path, **kwargs):
+        async def run():
+            items = []
+            async for item in self.client._stream_json(
+                    "https://test" + path, **kwargs):
+                self.log.append(item)
+                items.append(item)
+            return items, self.client._etags
+
+        return asyncio.run(run())
+
+    @unittest.skipIf(ijson is None, "ijson not installed")
+    def test_multi_chunk(self):
+        chunks = [b'[{"path": "a"}, {"pa', b'th": "b"}, ', b'{"path": "c"}]']
+        self.bodies["/files"] = (chunks, None)
+
+        items, _ = self.stream("/files")
+
+        self.assertEqual(items, [{"path": "a"}, {"path": "b"}, {"path": "c"}])
+        # Items are yielded before the body has finished arriving.
+        self.assertLess(
+            self.log.index({"path": "a"}), self.log.index(chunks[-1])
+        )
+
+    @unittest.skipIf(ijson is None, "ijson not installed")
+    def test_not_modified(self):
+        self.bodies["/files"] = ([b'[{"path": "a"}]'], '"v1"')
+
+        first, _ = self.stream("/files", etag=True)
+        first[0]["path"] = "mutated"
+
+        self.log.clear()
+        second, _ = self.stream("/files", etag=True)
+
+        self.assertEqual(second, [{"path": "a"}])
+        self.assertEqual(self.headers, [None, '"v1"'])
+        self.assertEqual(self.log, second)
+
+    @unittest.skipIf(ijson is None, "ijson not installed")
+    def test_max_bytes(self):
+        item = b'{"path": "' + b"a" * 1024 + b'"}'
+        count = ETAG_MAX_BYTES // len(item) + 1
+        chunks = [b"["] + [item + b","] * (count - 1) + [item + b"]"]
+
+        self.bodies["/files"] = ([b"[" + item + b"]"], '"v0"')
+        self.stream("/files", etag=True)
+        self.assertEqual(len(self.client._etags), 1)
+
+        # The listing grew past the limit, the old entry is dropped.
+        self.bodies["/files"] = (chunks, '"v1"')
+        items, etags = self.stream("/files", etag=True)
+
+        self.assertEqual(len(items), count)
+        self.assertEqual(len(etags), 0)
+
+    @unittest.skipIf(ijson is None, "ijson not installed")
+    def test_not_found(self):
+        self.bodies["/files"] = (None, None)
+
+        with self.assertRaises(NotFound):
+            self.stream("/files")
+
+    def test_fallback(self):
+        self.bodies["/files"] = ([b'[{"path": "a"}, {"path": "b"}]'], '"v1"')
+
+        with mock.patch("dathost.http.awaiting.ijson", None):
+            self.stream("/files", etag=True)
+            items, etags = self.stream("/files", etag=True)
+
+        self.assertEqual(items, [{"path": "a"}, {"path": "b"}])
+        self.assertEqual(self.headers, [None, '"v1"'])
+        self.assertEqual(len(etags), 1)
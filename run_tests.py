@@ -4,6 +4,12 @@ import sys
 
 from dathost.tests.test_blocking import TestBlockingClient
 from dathost.tests.test_awaiting import TestAwaitingClient
+from dathost.tests.test_http import (  # noqa: F401
+    TestEtagCache,
+    TestServerCache,
+    TestStreamJson
+)
+from dathost.tests.test_console import TestConsoleLines  # noqa: F401
 
 
 cli = argparse.ArgumentParser()
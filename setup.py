@@ -4,9 +4,16 @@ import re
 from setuptools import setup
 
 
+with open(os.path.join("dathost", "__init__.py")) as f:
+    INIT = f.read()
+
+
 def get_requirements():
     with open("requirements.txt") as f:
-        return f.read().splitlines()
+        return [
+            line.strip() for line in f.read().splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
 
 
 def get_long_description():
@@ -14,11 +21,29 @@ def get_long_description():
         return f.read()
 
 
+def get_ext_modules():
+    # Opt-in, compiled wheels are only built when DATHOST_MYPYC is set.
+    if not os.environ.get("DATHOST_MYPYC"):
+        return []
+
+    from mypyc.build import mypycify
+
+    return mypycify([
+        "--follow-imports=silent",
+        "--ignore-missing-imports",
+        os.path.join("dathost", "models", "account.py"),
+        os.path.join("dathost", "models", "backup.py"),
+        os.path.join("dathost", "models", "file.py"),
+        os.path.join("dathost", "models", "match.py"),
+        os.path.join("dathost", "models", "metrics.py"),
+        os.path.join("dathost", "models", "server.py"),
+    ])
+
+
 def get_variable(variable):
-    with open(os.path.join("dathost", "__init__.py")) as f:
-        return re.search(
-            "{} = ['\"]([^'\"]+)['\"]".format(variable), f.read()
-        ).group(1)
+    return re.search(
+        "^{} = ['\"]([^'\"]+)['\"]".format(variable), INIT, re.MULTILINE
+    ).group(1)
 
 
 setup(
@@ -31,6 +56,14 @@ setup(
     author=get_variable("__author__"),
     author_email=get_variable("__author_email__"),
     install_requires=get_requirements(),
+    extras_require={
+        "fast": [
+            "ijson>=3.1",
+            "orjson",
+            "httpx[http2]",
+            "uvloop; sys_platform != 'win32'"
+        ]
+    },
     license=get_variable("__license__"),
     packages=[
         "dathost",
@@ -43,6 +76,7 @@ setup(
         "dathost.match",
     ],
     python_requires=">=3.6",
+    ext_modules=get_ext_modules(),
     include_package_data=True,
     zip_safe=False
 )